@@ -42,6 +42,7 @@ class ImageViewer:
         self.relevant_keys = relevant_keys
         self._window = None
         self._pressed_keys = []
+        self._sorted_pressed_keys = ()
         self._is_escape_pressed = False
 
     @property
@@ -56,8 +57,14 @@ class ImageViewer:
 
     @property
     def pressed_keys(self):
-        """Return a sorted list of the pressed keys."""
-        return tuple(sorted(self._pressed_keys))
+        """Return a sorted tuple of the pressed keys.
+
+        Note:
+            the same tuple object is returned until a relevant key event
+            occurs, so callers can detect changes using an identity check
+
+        """
+        return self._sorted_pressed_keys
 
     def _handle_key_event(self, symbol, is_press):
         """Handle a key event.
@@ -84,6 +91,8 @@ class ImageViewer:
             self._pressed_keys.append(symbol)
         else:
             self._pressed_keys.remove(symbol)
+        # sort the pressed keys once per event instead of once per access
+        self._sorted_pressed_keys = tuple(sorted(self._pressed_keys))
 
     def on_key_press(self, symbol, modifiers):
         """Respond to a key press on the keyboard."""
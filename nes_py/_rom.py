@@ -4,10 +4,9 @@ Notes:
     - http://wiki.nesdev.com/w/index.php/INES
 """
 
+import mmap
 import os
-from functools import cached_property
-
-import numpy as np
+import struct
 
 
 class ROM:
@@ -15,7 +14,14 @@ class ROM:
 
     # the magic bytes expected at the first four bytes of the header.
     # It spells "NES<END>"
-    _MAGIC = np.array([0x4E, 0x45, 0x53, 0x1A])
+    _MAGIC = b"NES\x1a"
+
+    # the bytes expected in the zero fill at the end of the header
+    _ZERO_FILL = b"\x00" * 5
+
+    # the layout of the 16 byte iNES header: the magic bytes, 7 single byte
+    # fields, and the zero fill
+    _HEADER_FORMAT = struct.Struct("<4s7B5s")
 
     def __init__(self, rom_path):
         """Initialize a new ROM.
@@ -34,193 +40,151 @@ class ROM:
         if not os.path.exists(rom_path):
             msg = f"rom_path points to non-existent file: {rom_path}."
             raise ValueError(msg)
-        # read the binary data in the .nes ROM file
-        self.raw_data = np.fromfile(rom_path, dtype="uint8")
+        # store the ROM path
+        self.rom_path = rom_path
+        # map the binary data in the .nes ROM file into memory, falling back
+        # to reading the file when it cannot be mapped (i.e., empty files)
+        with open(rom_path, "rb") as rom_file:
+            try:
+                self._buffer = mmap.mmap(rom_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                self._buffer = rom_file.read()
+        self.raw_data = memoryview(self._buffer)
+        # unpack the header into native Python values. flags 10 are not part
+        # of official specification and are ignored in this emulator
+        if len(self.raw_data) < self._HEADER_FORMAT.size:
+            raise ValueError("ROM missing magic number in header.")
+        (
+            self._magic,
+            prg_rom_banks,
+            chr_rom_banks,
+            self.flags_6,
+            self.flags_7,
+            prg_ram_banks,
+            self.flags_9,
+            self.flags_10,
+            self._zero_fill,
+        ) = self._HEADER_FORMAT.unpack_from(self.raw_data)
         # ensure the first 4 bytes are 0x4E45531A (NES<EOF>)
-        if not np.array_equal(self._magic, self._MAGIC):
+        if self._magic != self._MAGIC:
             raise ValueError("ROM missing magic number in header.")
-        if self._zero_fill != 0:
+        if self._zero_fill != self._ZERO_FILL:
             raise ValueError("ROM header zero fill bytes are not zero.")
+        # the fields are cheap integer operations over the header that are
+        # all needed to validate the ROM, so compute them eagerly
+        self._read_header(prg_rom_banks, chr_rom_banks, prg_ram_banks)
+        self._read_header_flags()
+        self._read_rom()
 
-    #
-    # MARK: Header
-    #
-
-    @cached_property
-    def header(self):
-        """Return the header of the ROM file as bytes."""
-        return self.raw_data[:16]
-
-    @cached_property
-    def _magic(self):
-        """Return the magic bytes in the first 4 bytes."""
-        return self.header[:4]
-
-    @cached_property
-    def prg_rom_size(self):
-        """Return the size of the PRG ROM in KB."""
-        return 16 * int(self.header[4])
-
-    @cached_property
-    def chr_rom_size(self):
-        """Return the size of the CHR ROM in KB."""
-        return 8 * int(self.header[5])
-
-    @cached_property
-    def flags_6(self):
-        """Return the flags at the 6th byte of the header."""
-        return f"{self.header[6]:08b}"
-
-    @cached_property
-    def flags_7(self):
-        """Return the flags at the 7th byte of the header."""
-        return f"{self.header[7]:08b}"
-
-    @cached_property
-    def prg_ram_size(self):
-        """Return the size of the PRG RAM in KB."""
-        size = self.header[8]
-        # size becomes 8 when it's zero for compatibility
-        if size == 0:
-            size = 1
-
-        return 8 * size
-
-    @cached_property
-    def flags_9(self):
-        """Return the flags at the 9th byte of the header."""
-        return f"{self.header[9]:08b}"
-
-    @cached_property
-    def flags_10(self):
-        """Return the flags at the 10th byte of the header.
+    def close(self):
+        """Close the ROM and release the memory mapped file.
 
-        Notes:
-            - these flags are not part of official specification.
-            - ignored in this emulator
+        Note:
+            if a caller still holds a view into the ROM (i.e., a slice of
+            `prg_rom` or a buffer exported from it), that view and the file
+            stay alive until the caller releases it
 
         """
-        return f"{self.header[10]:08b}"
-
-    @cached_property
-    def _zero_fill(self):
-        """Return the zero fill bytes at the end of the header."""
-        return self.header[11:].sum()
+        # release the views into the file before the file itself. views with
+        # buffers exported to callers stay alive, and are released once they
+        # and this reference are collected
+        for view in (self.trainer_rom, self.prg_rom, self.chr_rom, self.raw_data):
+            try:
+                view.release()
+            except BufferError:
+                pass
+        if isinstance(self._buffer, mmap.mmap):
+            try:
+                self._buffer.close()
+            except BufferError:
+                pass
+        self._buffer = b""
 
     #
-    # MARK: Header Flags
+    # MARK: Header
     #
 
-    @cached_property
-    def mapper(self):
-        """Return the mapper number this ROM uses."""
-        # the high nibble is in flags 7, the low nibble is in flags 6
-        return int(self.flags_7[:4] + self.flags_6[:4], 2)
+    def _read_header(self, prg_rom_banks, chr_rom_banks, prg_ram_banks):
+        """Read the sizes stored in the header.
 
-    @cached_property
-    def is_ignore_mirroring(self):
-        """Return a boolean determining if the ROM ignores mirroring."""
-        return bool(int(self.flags_6[4]))
+        Args:
+            prg_rom_banks (int): the number of 16KB PRG ROM banks
+            chr_rom_banks (int): the number of 8KB CHR ROM banks
+            prg_ram_banks (int): the number of 8KB PRG RAM banks
 
-    @cached_property
-    def has_trainer(self):
-        """Return a boolean determining if the ROM has a trainer block."""
-        return bool(int(self.flags_6[5]))
+        Returns:
+            None
 
-    @cached_property
-    def has_battery_backed_ram(self):
-        """Return a boolean determining if the ROM has a battery-backed RAM."""
-        return bool(int(self.flags_6[6]))
+        """
+        # the header of the ROM file as bytes. copying the 16 bytes keeps the
+        # header readable (as native ints) after the ROM is closed
+        self.header = bytes(self.raw_data[:16])
+        # the size of the PRG ROM in KB
+        self.prg_rom_size = 16 * prg_rom_banks
+        # the size of the CHR ROM in KB
+        self.chr_rom_size = 8 * chr_rom_banks
+        # the size of the PRG RAM in KB. the size becomes 8 when it's zero
+        # for compatibility
+        self.prg_ram_size = 8 * (prg_ram_banks or 1)
 
-    @cached_property
-    def is_vertical_mirroring(self):
-        """Return the mirroring mode this ROM uses."""
-        return bool(int(self.flags_6[7]))
+    #
+    # MARK: Header Flags
+    #
 
-    @cached_property
-    def has_play_choice_10(self):
-        """Return whether this cartridge uses PlayChoice-10.
+    def _read_header_flags(self):
+        """Read the flags stored in the header.
 
-        Note:
+        Notes:
             - Play-Choice 10 uses different color palettes for a different PPU
-            - ignored in this emulator
+            - VS Uni-system is for ROMs that have a coin slot (Arcades).
+            - Play-Choice 10 and VS Uni-system are ignored in this emulator
 
         """
-        return bool(int(self.flags_7[6]))
-
-    @cached_property
-    def has_vs_unisystem(self):
-        """Return whether this cartridge has VS Uni-system.
-
-        Note:
-            VS Uni-system is for ROMs that have a coin slot (Arcades).
-            - ignored in this emulator
-
-        """
-        return bool(int(self.flags_7[7]))
-
-    @cached_property
-    def is_pal(self):
-        """Return the TV system this ROM supports."""
-        return bool(int(self.flags_9[7]))
+        # the mapper number this ROM uses. the high nibble is in flags 7, the
+        # low nibble is in flags 6
+        self.mapper = (self.flags_7 & 0xF0) | (self.flags_6 >> 4)
+        # whether the ROM ignores mirroring
+        self.is_ignore_mirroring = bool(self.flags_6 & 0b00001000)
+        # whether the ROM has a trainer block
+        self.has_trainer = bool(self.flags_6 & 0b00000100)
+        # whether the ROM has a battery-backed RAM
+        self.has_battery_backed_ram = bool(self.flags_6 & 0b00000010)
+        # the mirroring mode this ROM uses
+        self.is_vertical_mirroring = bool(self.flags_6 & 0b00000001)
+        # whether this cartridge uses PlayChoice-10
+        self.has_play_choice_10 = bool(self.flags_7 & 0b00000010)
+        # whether this cartridge has VS Uni-system
+        self.has_vs_unisystem = bool(self.flags_7 & 0b00000001)
+        # the TV system this ROM supports
+        self.is_pal = bool(self.flags_9 & 0b00000001)
 
     #
     # MARK: ROM
     #
 
-    @cached_property
-    def trainer_rom_start(self):
-        """The inclusive starting index of the trainer ROM."""
-        return 16
-
-    @cached_property
-    def trainer_rom_stop(self):
-        """The exclusive stopping index of the trainer ROM."""
+    def _read_rom(self):
+        """Read the trainer, PRG, and CHR ROM blocks of the ROM file."""
+        # the inclusive starting index of the trainer ROM
+        self.trainer_rom_start = 16
+        # the exclusive stopping index of the trainer ROM
         if self.has_trainer:
-            return 16 + 512
+            self.trainer_rom_stop = 16 + 512
         else:
-            return 16
-
-    @cached_property
-    def trainer_rom(self):
-        """Return the trainer ROM of the ROM file."""
-        return self.raw_data[self.trainer_rom_start : self.trainer_rom_stop]
-
-    @cached_property
-    def prg_rom_start(self):
-        """The inclusive starting index of the PRG ROM."""
-        return self.trainer_rom_stop
-
-    @cached_property
-    def prg_rom_stop(self):
-        """The exclusive stopping index of the PRG ROM."""
-        return self.prg_rom_start + self.prg_rom_size * 2**10
-
-    @cached_property
-    def prg_rom(self):
-        """Return the PRG ROM of the ROM file."""
-        try:
-            return self.raw_data[self.prg_rom_start : self.prg_rom_stop]
-        except IndexError:
-            raise ValueError("failed to read PRG-ROM on ROM.")
-
-    @cached_property
-    def chr_rom_start(self):
-        """The inclusive starting index of the CHR ROM."""
-        return int(self.prg_rom_stop)
-
-    @cached_property
-    def chr_rom_stop(self):
-        """The exclusive stopping index of the CHR ROM."""
-        return self.chr_rom_start + self.chr_rom_size * 2**10
-
-    @cached_property
-    def chr_rom(self):
-        """Return the CHR ROM of the ROM file."""
-        try:
-            return self.raw_data[self.chr_rom_start : self.chr_rom_stop]
-        except IndexError:
-            raise ValueError("failed to read CHR-ROM on ROM.")
+            self.trainer_rom_stop = 16
+        # the trainer ROM of the ROM file
+        self.trainer_rom = self.raw_data[self.trainer_rom_start : self.trainer_rom_stop]
+        # the inclusive starting index of the PRG ROM
+        self.prg_rom_start = self.trainer_rom_stop
+        # the exclusive stopping index of the PRG ROM
+        self.prg_rom_stop = self.prg_rom_start + self.prg_rom_size * 2**10
+        # the PRG ROM of the ROM file
+        self.prg_rom = self.raw_data[self.prg_rom_start : self.prg_rom_stop]
+        # the inclusive starting index of the CHR ROM
+        self.chr_rom_start = self.prg_rom_stop
+        # the exclusive stopping index of the CHR ROM
+        self.chr_rom_stop = self.chr_rom_start + self.chr_rom_size * 2**10
+        # the CHR ROM of the ROM file
+        self.chr_rom = self.raw_data[self.chr_rom_start : self.chr_rom_stop]
 
 
 # explicitly define the outward facing API of this module
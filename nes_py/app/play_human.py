@@ -1,6 +1,8 @@
 """A method to play gym environments using human IO inputs."""
 
 import time
+from collections.abc import Callable
+from typing import cast
 
 import gymnasium as gym
 from pyglet import clock
@@ -31,14 +33,13 @@ def play_human(env: NESEnv, callback=None):
     is_rgb = len(obs_s.shape) == 3 and obs_s.shape[2] in [1, 3]
     assert is_bw or is_rgb
     # get the mapping of keyboard keys to actions in the environment
-    if hasattr(env, "get_keys_to_action"):
-        keys_to_action = env.get_keys_to_action()
-    elif hasattr(env.unwrapped, "get_keys_to_action") and callable(
-        getattr(env.unwrapped, "get_keys_to_action")
-    ):
-        keys_to_action = getattr(env.unwrapped, "get_keys_to_action")()
-    else:
+    get_keys_to_action: Callable[[], dict] | None
+    get_keys_to_action = getattr(env, "get_keys_to_action", None)
+    if get_keys_to_action is None:
+        get_keys_to_action = getattr(env.unwrapped, "get_keys_to_action", None)
+    if not callable(get_keys_to_action):
         raise ValueError("env has no get_keys_to_action method")
+    keys_to_action = get_keys_to_action()
     # create the image viewer
     viewer = ImageViewer(
         env.spec.id if env.spec is not None else env.__class__.__name__,
@@ -53,21 +54,31 @@ def play_human(env: NESEnv, callback=None):
     # prepare frame rate limiting
     target_frame_duration = 1 / env.metadata["render_fps"]
     last_frame_time = 0
+    # cache the last key combination and its action to skip hashing the
+    # pressed keys while the player holds the same buttons
+    last_pressed_keys = None
+    action = _NOP
+    # resolve the unwrapped environment once instead of on every frame
+    unwrapped = cast(NESEnv, env.unwrapped)
+    show = viewer.show
     # start the main game loop
     try:
         while True:
-            current_frame_time = time.time()
-            # limit frame rate
-            if last_frame_time + target_frame_duration > current_frame_time:
-                continue
+            # limit frame rate by sleeping until the next frame is due
+            sleep_for = last_frame_time + target_frame_duration - time.perf_counter()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
             # save frame beginning time for next refresh
-            last_frame_time = current_frame_time
+            last_frame_time = time.perf_counter()
             # clock tick
             clock.tick()
             # unwrap the action based on pressed relevant keys
-            action = keys_to_action.get(viewer.pressed_keys, _NOP)
+            pressed_keys = viewer.pressed_keys
+            if pressed_keys is not last_pressed_keys:
+                action = keys_to_action.get(pressed_keys, _NOP)
+                last_pressed_keys = pressed_keys
             next_observation, reward, terminated, truncated, _ = env.step(action)
-            viewer.show(getattr(env.unwrapped, "screen"))
+            show(unwrapped.screen)
             # pass the observation data through the callback
             if callback is not None:
                 callback(observation, action, reward, terminated, next_observation)
@@ -76,7 +87,7 @@ def play_human(env: NESEnv, callback=None):
             # reset if the environment is terminated
             if terminated or truncated:
                 observation, info = env.reset()
-                viewer.show(getattr(env.unwrapped, "screen"))
+                show(unwrapped.screen)
 
             # shutdown if the escape key is pressed
             if viewer.is_escape_pressed:
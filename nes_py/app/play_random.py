@@ -2,6 +2,9 @@
 
 from tqdm import tqdm
 
+# the number of steps between updates to the progress bar postfix
+_POSTFIX_INTERVAL = 16
+
 
 def play_random(env, steps):
     """Play the environment making uniformly random decisions.
@@ -18,12 +21,15 @@ def play_random(env, steps):
         terminated = True
         truncated = True
         progress = tqdm(range(steps))
-        for _ in progress:
+        for step in progress:
             if terminated or truncated:
                 _ = env.reset()
             action = env.action_space.sample()
             _, reward, terminated, truncated, info = env.step(action)
-            progress.set_postfix(reward=reward, info=info)
+            # formatting the postfix re-renders the bar, so only do it
+            # periodically instead of on every step
+            if step % _POSTFIX_INTERVAL == 0:
+                progress.set_postfix(reward=reward, info=info, refresh=False)
             env.render()
     except KeyboardInterrupt:
         pass
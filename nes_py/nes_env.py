@@ -106,7 +106,8 @@ class NESEnv(gym.Env):
         """Create a new NES environment.
 
         Args:
-            rom_path (str): the path to the ROM for the environment
+            rom_path (str | ROM): the path to the ROM for the environment, or
+              an already parsed ROM to share between environments
             max_episode_steps (int, optional): the maximum number of steps per episode before truncation
             truncate_function (Callable, None): a function to determine if the episode should be truncated it must take the 3 following arguments:
             - self: the environment instance (to possibly access / add instance variables)
@@ -117,25 +118,32 @@ class NESEnv(gym.Env):
             None
 
         """
-        # create a ROM file from the ROM path
-        rom = ROM(rom_path)
-        # check that there is PRG ROM
-        if rom.prg_rom_size == 0:
-            raise ValueError("ROM has no PRG-ROM banks.")
-        # ensure that there is no trainer
-        if rom.has_trainer:
-            raise ValueError("ROM has trainer. trainer is not supported.")
-        # try to read the PRG ROM and raise a value error if it fails
-        _ = rom.prg_rom
-        # try to read the CHR ROM and raise a value error if it fails
-        _ = rom.chr_rom
-        # check the TV system
-        if rom.is_pal:
-            raise ValueError("ROM is PAL. PAL is not supported.")
-        # check that the mapper is implemented
-        elif rom.mapper not in {0, 1, 2, 3}:
-            msg = "ROM has an unsupported mapper number {}. please see https://github.com/Kautenja/nes-py/issues/28 for more information."
-            raise ValueError(msg.format(rom.mapper))
+        # create a ROM file from the ROM path unless a parsed ROM is given
+        is_shared_rom = isinstance(rom_path, ROM)
+        if is_shared_rom:
+            rom = rom_path
+            rom_path = rom.rom_path
+        else:
+            rom = ROM(rom_path)
+        # validate the ROM, always releasing the ROM file afterward unless it
+        # is shared. the C++ emulator reads the ROM on its own
+        try:
+            # check that there is PRG ROM
+            if rom.prg_rom_size == 0:
+                raise ValueError("ROM has no PRG-ROM banks.")
+            # ensure that there is no trainer
+            if rom.has_trainer:
+                raise ValueError("ROM has trainer. trainer is not supported.")
+            # check the TV system
+            if rom.is_pal:
+                raise ValueError("ROM is PAL. PAL is not supported.")
+            # check that the mapper is implemented
+            elif rom.mapper not in {0, 1, 2, 3}:
+                msg = "ROM has an unsupported mapper number {}. please see https://github.com/Kautenja/nes-py/issues/28 for more information."
+                raise ValueError(msg.format(rom.mapper))
+        finally:
+            if not is_shared_rom:
+                rom.close()
         # create a dedicated random number generator for the environment
         self.np_random = np.random.default_rng()
         # store the ROM path
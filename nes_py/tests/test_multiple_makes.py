@@ -4,10 +4,36 @@ from multiprocessing import Process
 from threading import Thread
 from unittest import TestCase
 
+from nes_py._rom import ROM
 from nes_py.nes_env import NESEnv
 
 from .rom_file_abs_path import rom_file_abs_path
 
+# the ROMs parsed by _load_rom keyed by path, shared within a process
+_rom_cache = {}
+
+
+def _load_rom(path):
+    """Return the parsed ROM at the given path, parsing it only once.
+
+    Args:
+        path (str): the path to the ROM file
+
+    Returns:
+        the parsed ROM, shared between calls
+
+    """
+    if path not in _rom_cache:
+        _rom_cache[path] = ROM(path)
+    return _rom_cache[path]
+
+
+def tearDownModule():
+    """Close the ROMs cached by the tests in this module."""
+    for rom in _rom_cache.values():
+        rom.close()
+    _rom_cache.clear()
+
 
 def play(steps):
     """Play the environment making uniformly random decisions.
@@ -21,7 +47,7 @@ def play(steps):
     """
     # create an NES environment with Super Mario Bros.
     path = rom_file_abs_path("super-mario-bros-1.nes")
-    env = NESEnv(path)
+    env = NESEnv(_load_rom(path))
     # step the environment for some arbitrary number of steps
     terminated = True
     for _ in range(steps):
@@ -46,6 +72,12 @@ class ShouldMakeMultipleEnvironmentsParallel:
     # the number of steps to take per environment
     steps = 10
 
+    def setUp(self):
+        # parse the ROM once in the parent so that threads and forked
+        # processes inherit the cached ROM instead of parsing their own.
+        # spawned processes fall back to parsing the ROM on first use
+        _load_rom(rom_file_abs_path("super-mario-bros-1.nes"))
+
     def test(self):
         procs = [None] * self.num_execs
         args = (self.steps,)
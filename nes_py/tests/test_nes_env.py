@@ -5,7 +5,9 @@ from unittest import TestCase
 import gymnasium as gym
 import numpy as np
 
+from nes_py._rom import ROM
 from nes_py.nes_env import NESEnv
+from nes_py.wrappers import JoypadSpace
 
 from .rom_file_abs_path import rom_file_abs_path
 
@@ -49,6 +51,17 @@ class ShouldCreateInstanceOfNESEnv(TestCase):
         env.close()
 
 
+class ShouldCreateInstanceOfNESEnvFromROM(TestCase):
+    def test(self):
+        rom = ROM(rom_file_abs_path("super-mario-bros-1.nes"))
+        env = NESEnv(rom)
+        self.assertIsInstance(env, gym.Env)
+        env.close()
+        # the shared ROM should remain open for other environments
+        self.assertEqual(rom.prg_rom_size * 2**10, len(rom.prg_rom))
+        rom.close()
+
+
 def create_smb1_instance():
     """Return a new SMB1 instance."""
     return NESEnv(rom_file_abs_path("super-mario-bros-1.nes"))
@@ -117,6 +130,8 @@ class ShouldStepEnvBackupRestore(TestCase):
                 observation, info = env.reset()
             observation, _, terminated, _, _ = env.step(0)
 
+        # the observation is a view of the emulator's frame buffer that the
+        # emulator updates in place, so the backup frame has to be a copy
         backup = observation.copy()
 
         env._backup()
@@ -131,3 +146,21 @@ class ShouldStepEnvBackupRestore(TestCase):
         env._restore()
         self.assertTrue(np.array_equal(backup, env.screen))
         env.close()
+
+
+class ShouldStepJoypadSpace(TestCase):
+    def test(self):
+        actions = [["NOOP"], ["right"], ["right", "A"], ["start"]]
+        env = JoypadSpace(create_smb1_instance(), actions)
+        env.reset()
+        expected_bytes = [0b00000000, 0b10000000, 0b10000001, 0b00001000]
+        for action, expected in enumerate(expected_bytes):
+            env.step(np.int64(action))
+            self.assertEqual(expected, env.unwrapped.controllers[0][0])
+        env.step(1)
+        self.assertEqual(0b10000000, env.unwrapped.controllers[0][0])
+        # invalid actions should raise instead of wrapping around
+        self.assertRaises(KeyError, env.step, -1)
+        self.assertRaises(KeyError, env.step, np.int64(-1))
+        self.assertRaises(KeyError, env.step, len(actions))
+        env.close()
@@ -5,6 +5,9 @@ http://tuxnes.sourceforge.net/nesmapper.txt
 
 """
 
+import os
+import struct
+import tempfile
 from unittest import TestCase
 
 from nes_py._rom import ROM
@@ -29,6 +32,48 @@ class ShouldNotCreateInstanceOfROMWithInvaldROMFile(TestCase):
         self.assertRaises(ValueError, lambda: ROM(empty))
 
 
+class ShouldNotCreateInstanceOfROMWithInvalidHeader(TestCase):
+    def _assert_header_raises(self, header):
+        with tempfile.NamedTemporaryFile(suffix=".nes", delete=False) as rom_file:
+            rom_file.write(header + bytes(8 * 2**10))
+        try:
+            self.assertRaises(ValueError, lambda: ROM(rom_file.name))
+        finally:
+            os.remove(rom_file.name)
+
+    def test_magic(self):
+        self._assert_header_raises(b"NES\x00" + bytes(12))
+
+    def test_zero_fill(self):
+        self._assert_header_raises(b"NES\x1a" + bytes(7) + b"\x00\x00\x01\x00\x00")
+
+
+class ShouldCloseROM(TestCase):
+    def test(self):
+        rom = ROM(rom_file_abs_path("super-mario-bros-1.nes"))
+        rom.close()
+        self.assertRaises(ValueError, lambda: len(rom.prg_rom))
+        self.assertRaises(ValueError, lambda: len(rom.raw_data))
+        self.assertEqual(b"NES\x1a", rom.header[:4])
+
+    def test_with_exported_view(self):
+        rom = ROM(rom_file_abs_path("super-mario-bros-1.nes"))
+        view = rom.prg_rom[:10]
+        rom.close()
+        self.assertRaises(ValueError, lambda: len(rom.prg_rom))
+        # the caller's view stays readable until it is released
+        self.assertEqual(10, len(bytes(view)))
+        view.release()
+
+    def test_with_exported_buffer(self):
+        rom = ROM(rom_file_abs_path("super-mario-bros-1.nes"))
+        values = struct.iter_unpack("B", rom.prg_rom)
+        rom.close()
+        self.assertRaises(ValueError, lambda: len(rom.chr_rom))
+        # the view with an exported buffer stays readable for its consumer
+        self.assertEqual(rom.prg_rom_size * 2**10, len(list(values)))
+
+
 #
 # MARK: ROM Headers
 #
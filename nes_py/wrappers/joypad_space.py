@@ -1,5 +1,7 @@
 """An environment wrapper to convert binary to discrete action space."""
 
+from collections.abc import Callable
+
 import gymnasium as gym
 from gymnasium import Env, Wrapper
 
@@ -38,6 +40,10 @@ class JoypadSpace(Wrapper):
 
         """
         super().__init__(env)
+        # cache the unwrapped environment and its render method to skip
+        # walking the wrapper chain on every frame
+        self._unwrapped = env.unwrapped
+        self._unwrapped_render = self._unwrapped.render
         # create the new action space
         self.action_space = gym.spaces.Discrete(len(actions))
         # create the action map from the list of discrete actions
@@ -77,16 +83,17 @@ class JoypadSpace(Wrapper):
 
     def render(self, *args, **kwargs):
         """Render the environment."""
-        return self.env.unwrapped.render(*args, **kwargs)
+        return self._unwrapped_render(*args, **kwargs)
 
     def get_keys_to_action(self):
         """Return the dictionary of keyboard keys to actions."""
         # get the old mapping of keys to actions
-        if not hasattr(self.env.unwrapped, "get_keys_to_action") or not callable(
-            getattr(self.env.unwrapped, "get_keys_to_action")
-        ):
+        get_keys_to_action: Callable[[], dict] | None = getattr(
+            self._unwrapped, "get_keys_to_action", None
+        )
+        if not callable(get_keys_to_action):
             raise ValueError("self.env has no get_keys_to_action method")
-        old_keys_to_action = getattr(self.env.unwrapped, "get_keys_to_action")()
+        old_keys_to_action = get_keys_to_action()
         # invert the keys to action mapping to lookup key combos by action
         action_to_keys = {v: k for k, v in old_keys_to_action.items()}
         # create a new mapping of keys to actions